@@ -7,6 +7,7 @@ from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 from requests import Session
 from formsite_util.error import FormsiteFileDownloadException
+from formsite_util.consts import DOWNLOAD_CHUNK_SIZE
 
 
 FS_PREFIX_PAT = re.compile(r"((f|sig)-((\d+?)-)+)")
@@ -58,7 +59,8 @@ def filter_urls(
     """Filter list of URLs and filenames based on input filters. Returns list of (url, filename, path)"""
     filtered_URLs = []
     filename_dict: Dict[str, List[str]] = {}
-    ls = os.listdir(download_dir)
+    with os.scandir(download_dir) as entries:
+        ls = {entry.name for entry in entries}
     subsitution_pattern = re.compile(filename_substitution_re_pat)
     # 1st pass - filter URLs
     for url in urls:
@@ -99,7 +101,7 @@ def download_sync(
             tmp_path = path + ".tmp"
             with session.get(url, stream=True, timeout=timeout) as resp:
                 with open(tmp_path, "wb") as fp:
-                    for content in resp.iter_content(chunk_size=4096):
+                    for content in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         fp.write(content)
             shutil.move(tmp_path, path)
             status.ok = True
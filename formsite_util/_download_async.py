@@ -1,11 +1,11 @@
-"""This module contains the functionality for downloading downloading many urls concurrently with a worker based queue+semaphore asyncio approach."""
+"""This module contains the functionality for downloading downloading many urls concurrently with a worker based queue asyncio approach."""
 
 from __future__ import annotations
 import os
-from collections import namedtuple
+from collections import deque, namedtuple
 import asyncio
 import shutil
-from typing import Callable, List, Optional, Protocol, Set, Tuple, Union, runtime_checkable
+from typing import Callable, Deque, List, Optional, Protocol, Set, Tuple, Union, runtime_checkable
 from aiohttp import (
     ClientSession,
     ClientTimeout,
@@ -15,6 +15,7 @@ from aiohttp import (
 )
 
 from formsite_util._logger import FormsiteLogger
+from formsite_util.consts import DOWNLOAD_CHUNK_SIZE, DOWNLOAD_WRITE_BUFFER_SIZE
 
 @runtime_checkable
 class AsyncDownloaderCallback(Protocol):
@@ -58,8 +59,6 @@ class AsyncFormDownloader:
         self.max_attempts = max_attempts
         self.logger: FormsiteLogger = FormsiteLogger()
         # ----
-        self.semaphore = asyncio.Semaphore(self.workers)
-        self.dl_queue: asyncio.Queue = asyncio.Queue()
         self.internal_state = DownloadWorkerState(
             self.url_path_list,
             self.workers,
@@ -69,16 +68,18 @@ class AsyncFormDownloader:
     async def run(self) -> None:
         """Entrypoint"""
         os.makedirs(self.download_dir, exist_ok=True)
-        async with ClientSession(connector=TCPConnector(limit=0)) as session:
-            for url, path in self.url_path_list:
-                dl = DownloadItem(url, path, 0)
-                self.dl_queue.put_nowait(dl)
+        self.dl_queue: Deque[DownloadItem] = deque()
+        # keep-alive connections are reused by the workers across files
+        connector = TCPConnector(limit=self.workers, ttl_dns_cache=300)
+        async with ClientSession(connector=connector) as session:
+            self.dl_queue.extend(
+                DownloadItem(url, path, 0) for url, path in self.url_path_list
+            )
             tasks = [
-                asyncio.ensure_future(
+                asyncio.create_task(
                     DownloadWorker(
                         self.download_dir,
                         self.dl_queue,
-                        self.semaphore,
                         session,
                         self.internal_state,
                         timeout=self.timeout,
@@ -88,7 +89,9 @@ class AsyncFormDownloader:
                 for _ in range(self.workers)
             ]
 
-            await asyncio.gather(*tasks)
+            await asyncio.wait(tasks)
+            for task in tasks:
+                task.result()  # re-raise worker errors like gather() did
 
 
 class DownloadWorkerState:
@@ -138,18 +141,19 @@ class DownloadWorkerState:
     def mark_success(self, dl: DownloadItem) -> None:
         """Increments internal counter to match completed downloads."""
         self.logger.debug(f"DownloadStatus: Success '{dl.url}' saved in '{dl.path}'")
-        self._mark(dl, "OK", self.success_urls, self.success)
+        self.success += 1
+        self._mark(dl, "OK", self.success_urls)
 
     def mark_fail(self, dl: DownloadItem, fail_exception: Exception) -> None:
         """Increments internal counter to match completed downloads."""
         self.logger.debug(f"DownloadStatus: Failure '{dl.url}'")
-        self._mark(dl, repr(fail_exception), self.failed_urls, self.failed)
+        self.failed += 1
+        self._mark(dl, repr(fail_exception), self.failed_urls)
 
-    def _mark(self, dl: DownloadItem, status: str, add_to: Set[str], count_to: int):
-        """Base method for changing internal state counts."""
+    def _mark(self, dl: DownloadItem, status: str, add_to: Set[str]):
+        """Base method for recording a completed download."""
         self.complete_urls.append(f"{dl.url} {status}")
         add_to.add(f"{dl.url}")
-        count_to += 1
 
     def end_iteration(self) -> None:
         """Runs at the end of a download iteration."""
@@ -163,13 +167,12 @@ class DownloadWorkerState:
 
 class DownloadWorker:
     """download_folder is a path to download directory
-    queue, semaphore, session, internal state and pbar are shared across all workers"""
+    queue, session, internal state and pbar are shared across all workers"""
 
     def __init__(
         self,
         download_folder: str,
-        queue: asyncio.Queue,
-        semaphore: asyncio.Semaphore,
+        queue: Deque[DownloadItem],
         session: ClientSession,
         internal_state: DownloadWorkerState,
         timeout: Union[int, float] = 160,
@@ -178,7 +181,6 @@ class DownloadWorker:
         # ----
         self.download_folder = download_folder
         self.queue = queue
-        self.semaphore = semaphore
         self.session = session
         self.internal_state = internal_state
         self.timeout = timeout
@@ -194,8 +196,7 @@ class DownloadWorker:
             try:
                 if self.internal_state.can_terminate_worker():
                     break
-                await self.semaphore.acquire()
-                dl: DownloadItem = await self.queue.get()
+                dl: DownloadItem = self.queue.popleft()  # non-empty, see try_exit
                 self.internal_state.start_iteration()
                 try:
                     await self._fetch(dl.url, dl.path)
@@ -205,18 +206,32 @@ class DownloadWorker:
             except asyncio.CancelledError:
                 pass
             finally:
-                self.semaphore.release()
                 self.internal_state.end_iteration()
 
-    async def _fetch(self, url: str, path: str, chunk_size: int = 4 * 1024):
-        """The core download function with `session.get` request."""
+    async def _fetch(self, url: str, path: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE):
+        """The core download function with `session.get` request.
+
+        All file operations run in the default executor, writing
+        `DOWNLOAD_WRITE_BUFFER_SIZE` batches of chunks at a time."""
+        loop = asyncio.get_running_loop()
+        tmp_path = f"{path}.tmp"
         async with self.session.get(url, timeout=self.client_timeout) as response:
             response.raise_for_status()
-            with open(f"{path}.tmp", "wb") as f:
+            f = await loop.run_in_executor(None, open, tmp_path, "wb")
+            try:
+                buffer: List[bytes] = []
+                buffered = 0
                 async for chunk in response.content.iter_chunked(chunk_size):
-                    f.write(chunk)
+                    buffer.append(chunk)
+                    buffered += len(chunk)
+                    if buffered >= DOWNLOAD_WRITE_BUFFER_SIZE:
+                        await loop.run_in_executor(None, f.writelines, buffer)
+                        buffer, buffered = [], 0
+                await loop.run_in_executor(None, f.writelines, buffer)
+            finally:
+                await loop.run_in_executor(None, f.close)
 
-        shutil.move(f"{path}.tmp", path)
+        await loop.run_in_executor(None, shutil.move, tmp_path, path)
         if self.callback is not None:
             self.callback(url, path, self.internal_state.total)
 
@@ -240,4 +255,4 @@ class DownloadWorker:
         new_dl = DownloadItem(dl.url, dl.path, dl.attempt + 1)
         self.internal_state.enqueued += 1
         self.logger.debug(f"DownloadStatus: Retry '{dl.url}' attempt {dl.attempt}")
-        self.queue.put_nowait(new_dl)
+        self.queue.append(new_dl)
@@ -3,9 +3,18 @@
 from __future__ import annotations
 import os
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
 import re
-from typing import Callable, Generator, List, Optional, Protocol, Set, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    runtime_checkable,
+)
 import pandas as pd
 from requests import Session
 
@@ -15,7 +24,6 @@ from formsite_util._parameters import FormsiteParameters
 from formsite_util._form_fetcher import FormFetcher
 from formsite_util._form_parser import FormParser
 from formsite_util._download import DownloadStatus, download_sync, filter_urls
-from formsite_util._download_async import AsyncFormDownloader
 from formsite_util._form_data import FormData
 from formsite_util._cache import (
     items_load,
@@ -25,6 +33,10 @@ from formsite_util._cache import (
     results_save,
 )
 
+if TYPE_CHECKING:
+    # aiohttp is only imported once an async download is requested
+    from formsite_util._download_async import AsyncFormDownloader
+
 
 @runtime_checkable
 class FormCallback(Protocol):
@@ -118,92 +130,97 @@ class FormsiteForm(FormData):
         self.logger.debug(f"{repr(self)} fetching with {params}")
         # -!- RESULTS PART
         parser = FormParser()
-        fetcher = FormFetcher(
+        with FormFetcher(
             self.form_id,
             self.token,
             self.server,
             self.directory,
             params,
-        )
-        if fetch_results:
-            # ---- handle cache ----
-            if cache_results_path is not None:
-                if not isinstance(cache_results_path, str):
-                    raise TypeError("Invalid path")
-                cached_results = results_load(cache_results_path)
-                if isinstance(cached_results, pd.DataFrame) and not cached_results.empty:
-                    if "id" not in cached_results.columns:
-                        raise ValueError(
-                            "Expected stored data to have the 'id' (Reference #) column. Add this to your results view."
+        ) as fetcher:
+            if fetch_results:
+                # ---- handle cache ----
+                cached_results = None
+                if cache_results_path is not None:
+                    if not isinstance(cache_results_path, str):
+                        raise TypeError("Invalid path")
+                    cached_results = results_load(cache_results_path)
+                    if isinstance(cached_results, pd.DataFrame) and not cached_results.empty:
+                        if "id" not in cached_results.columns:
+                            raise ValueError(
+                                "Expected stored data to have the 'id' (Reference #) column. Add this to your results view."
+                            )
+                        latest_id = int(cached_results["id"].max())
+                        self.logger.debug(
+                            f"Cache results {self.form_id}: Overwriting after_id:{latest_id} | before_id:None"
                         )
+                        fetcher.params.after_id = latest_id
+                        fetcher.params.before_id = None
+                # -!!- perform results fetch -!!-
+                for data in fetcher.fetch_iterator():
+                    page_received = monotonic()
+                    # --- edge case ---
+                    if not data.get("results") and not (
+                        isinstance(cached_results, pd.DataFrame) and not cached_results.empty
+                    ):
+                        raise FormsiteNoResultsException("No results in specified parameters")
+                    # --- regular case ---
+                    parser.feed(data)
+                    # --- callback ---
+                    if fetch_callback is not None and isinstance(
+                        fetch_callback, FormCallback
+                    ):
+                        fetch_callback(fetcher.cur_page, fetcher.total_pages, data)
+                    # --- fetch delay (only if another page follows) ---
+                    # time spent parsing this page already counts towards the delay
+                    if fetcher.cur_page <= fetcher.total_pages:
+                        sleep(max(fetch_delay - (monotonic() - page_received), 0))
+                # ---- finish handling cache ----
+                if cache_results_path is not None:
+                    new_data = parser.as_dataframe()
                     self.logger.debug(
-                        f"Cache results {self.form_id}: Overwriting after_id:{max(cached_results['id'])} | before_id:None"
+                        f"Cache results {self.form_id}: Appending {new_data.shape[0]} new results"
                     )
-                    fetcher.params.after_id = int(max(cached_results["id"]))
-                    fetcher.params.before_id = None
-            # -!!- perform results fetch -!!-
-            for data in fetcher.fetch_iterator():
-                # --- edge case ---
-                if not data.get("results") and not (
-                    isinstance(cached_results, pd.DataFrame) and not cached_results.empty
-                ):
-                    raise FormsiteNoResultsException("No results in specified parameters")
-                # --- regular case ---
-                parser.feed(data)
-                # --- callback ---
-                if fetch_callback is not None and isinstance(
-                    fetch_callback, FormCallback
-                ):
-                    fetch_callback(fetcher.cur_page, fetcher.total_pages, data)
-                # --- fetch delay ---
-                sleep(fetch_delay)
-            # ---- finish handling cache ----
-            if cache_results_path is not None:
-                new_data = parser.as_dataframe()
-                self.logger.debug(
-                    f"Cache results {self.form_id}: Appending {new_data.shape[0]} new results"
-                )
-                # --- if there are new results, merge ---
-                if new_data.shape[0] > 0:
-                    merged_results = pd.concat(
-                        [new_data, cached_results], ignore_index=True
-                    )
-                    merged_results = merged_results.reset_index(drop=True)
-                    merged_results = merged_results.drop_duplicates(
-                        subset=["id"],
-                        keep="first",
-                    )
-                    self._results = merged_results
-                    results_save(merged_results, cache_results_path)
-                # --- otherwise just use the data we got ---
+                    # --- if there are new results, merge ---
+                    if new_data.shape[0] > 0:
+                        merged_results = pd.concat(
+                            [new_data, cached_results], ignore_index=True
+                        )
+                        merged_results = merged_results.reset_index(drop=True)
+                        merged_results = merged_results.drop_duplicates(
+                            subset=["id"],
+                            keep="first",
+                        )
+                        self._results = merged_results
+                        results_save(merged_results, cache_results_path)
+                    # --- otherwise just use the data we got ---
+                    else:
+                        self._results = cached_results
                 else:
-                    self._results = cached_results
-            else:
-                self._results = parser.as_dataframe()
-            tz_shif_inplace(self._results, "date_update", params.timezone)
-            tz_shif_inplace(self._results, "date_start", params.timezone)
-            tz_shif_inplace(self._results, "date_finish", params.timezone)
-            if params.last is not None:
-                self._results = self._results.head(params.last)
-
-        # -!- ITEMS PART
-        if fetch_items:
-            if cache_items_path is not None:
-                if not isinstance(cache_items_path, str):
-                    raise TypeError("Invalid path")
-                cached_items = items_load(cache_items_path)
-                if cached_items is None or not items_match_data(
-                    cached_items, self._results.columns
-                ):
-                    self.logger.debug(
-                        f"Cache items {self.form_id}: Fetching new items for cache"
-                    )
-                    cached_items = fetcher.fetch_items(result_labels_id)
-                    items_save(cached_items, cache_items_path)
-                self.items = cached_items
-            else:
-                self.items = fetcher.fetch_items(result_labels_id)
-            self._update_labels()
+                    self._results = parser.as_dataframe()
+                tz_shif_inplace(self._results, "date_update", params.timezone)
+                tz_shif_inplace(self._results, "date_start", params.timezone)
+                tz_shif_inplace(self._results, "date_finish", params.timezone)
+                if params.last is not None:
+                    self._results = self._results.head(params.last)
+
+            # -!- ITEMS PART
+            if fetch_items:
+                if cache_items_path is not None:
+                    if not isinstance(cache_items_path, str):
+                        raise TypeError("Invalid path")
+                    cached_items = items_load(cache_items_path)
+                    if cached_items is None or not items_match_data(
+                        cached_items, self._results.columns
+                    ):
+                        self.logger.debug(
+                            f"Cache items {self.form_id}: Fetching new items for cache"
+                        )
+                        cached_items = fetcher.fetch_items(result_labels_id)
+                        items_save(cached_items, cache_items_path)
+                    self.items = cached_items
+                else:
+                    self.items = fetcher.fetch_items(result_labels_id)
+                self._update_labels()
 
         self._is_fetched = True  # set marker for __repr__
 
@@ -299,6 +316,8 @@ class FormsiteForm(FormData):
             overwrite_existing=overwrite_existing,
         )
         # ----
+        from formsite_util._download_async import AsyncFormDownloader
+
         downloader = AsyncFormDownloader(
             download_dir,
             filtered_URLs,
@@ -324,7 +343,8 @@ class FormsiteForm(FormData):
         )
         url_re = re.compile(url_re_pat)
         urls: Set[str] = set()
-        for col in self._results.columns:
+        # only text columns can hold URLs
+        for col in self._results.select_dtypes(include="object").columns:
             try:
                 url_mask: pd.Index = self._results[col].str.fullmatch(url_re) == True
                 tmp: pd.Series = self._results[url_mask][col]
@@ -334,6 +354,9 @@ class FormsiteForm(FormData):
             except AttributeError:
                 pass
 
+        urls.discard("")
+        if filter_re_pat == r".+":  # default filter matches any non-empty URL
+            return sorted(urls)
         # Return all URLs that match filter_re_pat
         filter_re = re.compile(filter_re_pat)
         return sorted([url for url in urls if filter_re.match(url)])
@@ -5,6 +5,7 @@ from os import PathLike
 from typing import Dict, Optional, Union, List
 from pathlib import Path
 import re
+import numpy as np
 import pandas as pd
 
 # ----
@@ -12,6 +13,57 @@ from formsite_util.error import InvalidItemsStructureException
 from formsite_util._logger import FormsiteLogger
 from formsite_util._form_parser import FormParser
 
+STRFTIME_TOKEN_RE = re.compile(r"%.|[^%]+|%$")
+# Directives that can be cut out of numpy's 'YYYY-MM-DDTHH:MM:SS' representation
+ISO_DIRECTIVE_SLICES = {
+    "%Y": slice(0, 4),
+    "%m": slice(5, 7),
+    "%d": slice(8, 10),
+    "%H": slice(11, 13),
+    "%M": slice(14, 16),
+    "%S": slice(17, 19),
+}
+
+
+def strftime_series(dates: pd.Series, date_format: str) -> pd.Series:
+    """Formats a datetime Series like `Series.dt.strftime`, without calling strftime per value.
+
+    Formats made only of %Y %m %d %H %M %S %% and literal text are assembled
+    from numpy's ISO representation of the whole column at once, anything
+    else falls back to `Series.dt.strftime`.
+    """
+    tokens = STRFTIME_TOKEN_RE.findall(date_format)
+    if any(t[0] == "%" and t not in ISO_DIRECTIVE_SLICES and t != "%%" for t in tokens):
+        return dates.dt.strftime(date_format)
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)  # keep local wall time, as strftime would
+    n = len(dates)
+    chars = dates.to_numpy("datetime64[s]").astype("U19").view("U1").reshape(n, 19)
+    pieces = []
+    for t in tokens:
+        if t in ISO_DIRECTIVE_SLICES:
+            pieces.append(chars[:, ISO_DIRECTIVE_SLICES[t]])
+        else:
+            literal = np.array(list("%" if t == "%%" else t), dtype="U1")
+            pieces.append(np.broadcast_to(literal, (n, len(literal))))
+    width = sum(piece.shape[1] for piece in pieces)
+    if width == 0:
+        formatted = np.full(n, "", dtype=object)
+    else:
+        formatted = np.concatenate(pieces, axis=1).view(f"U{width}").ravel()
+    return pd.Series(formatted, index=dates.index, dtype=object).where(dates.notna())
+
+
+def strftime_date_cols(df: pd.DataFrame, date_format: str) -> pd.DataFrame:
+    """Returns `df` with every datetime column formatted as strings using `date_format`"""
+    date_cols = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+    if date_cols.empty:
+        return df
+    df = df.copy()
+    for col in date_cols:
+        df[col] = strftime_series(df[col], date_format)
+    return df
+
 
 class FormData:
     """Formsite API Form object, representing the data"""
@@ -190,8 +242,9 @@ class FormData:
         if df is None:
             raise ValueError("Form doesn't have items defined. It is impossible to create results_labels")
 
-        if "date_format" not in kwargs:
-            kwargs["date_format"] = "%Y-%m-%d %H:%M:%S"
+        date_format = kwargs.pop("date_format", "%Y-%m-%d %H:%M:%S")
+        if date_format is not None:
+            df = strftime_date_cols(df, date_format)
         if "index" not in kwargs:
             kwargs["index"] = False
         if "encoding" not in kwargs:
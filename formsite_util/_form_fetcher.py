@@ -1,7 +1,8 @@
 """Defines the FormFetcher object and its logic."""
 
+from contextlib import contextmanager
 from time import sleep
-from typing import Dict, Generator
+from typing import Dict, Generator, Optional
 from requests import Session, Response, HTTPError
 from requests.exceptions import ConnectionError as requests_ConnectionError
 from formsite_util.error import (
@@ -14,7 +15,12 @@ from formsite_util.error import (
 )
 from formsite_util._logger import FormsiteLogger
 from formsite_util._parameters import FormsiteParameters
-from formsite_util.consts import ConnectionError_DELAY, HTTP_429_WAIT_DELAY
+from formsite_util.consts import ConnectionError_DELAY, FETCH_RETRIES, HTTP_429_WAIT_DELAY
+
+try:  # orjson is an optional, faster drop-in for decoding large result pages
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 class FormFetcher:
@@ -44,6 +50,8 @@ class FormFetcher:
         self.url_results: str = f"{self.url_base}/forms/{self.form_id}/results"
         self.url_items: str = f"{self.url_base}/forms/{self.form_id}/items"
         self.auth_header: Dict[str, str] = {"Authorization": f"bearer {token}"}
+        # shared by all fetches while used as a context manager
+        self._session: Optional[Session] = None
         # ----
         self.total_pages: int = 1
         self.cur_page: int = 1
@@ -52,6 +60,33 @@ class FormFetcher:
     def __repr__(self) -> str:
         return f"<{type(self).__name__} {self.form_id}>"
 
+    def __enter__(self) -> "FormFetcher":
+        self._session = self._new_session()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the HTTP session shared by fetches inside the `with` block"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _new_session(self) -> Session:
+        session = Session()
+        session.headers.update(self.auth_header)
+        return session
+
+    @contextmanager
+    def _session_scope(self) -> Generator[Session, None, None]:
+        """Yields the shared session if open, otherwise one that is closed after the fetch"""
+        if self._session is not None:
+            yield self._session
+        else:
+            with self._new_session() as session:
+                yield session
+
     def fetch_iterator(self) -> Generator[dict, None, None]:
         """Iterates through all HTTP response pages
 
@@ -60,21 +95,25 @@ class FormFetcher:
         """
         # max_page_sz = 500
         # page_sz = self.results_params.get("limit", max_page_sz)
-        with Session() as session:
-            session.headers.update(self.auth_header)
+        rate_limited = 0  # consecutive HTTP 429 responses
+        with self._session_scope() as session:
             while True:
                 try:
                     if self.cur_page > self.total_pages:
                         return StopIteration # type: ignore
                     resp = self.fetch_result(self.cur_page, session)
                     self.handle_response(resp)
+                    rate_limited = 0
                     self.total_pages = int(resp.headers.get("Pagination-Page-Last", 0))
                     self.logger.debug(
                         f"Formsite API fetch {self.form_id} results | {self.cur_page}/{self.total_pages}"
                     )
                     self.cur_page += 1
-                    yield resp.json()
+                    yield json_loads(resp.content)
                 except FormsiteRateLimitException:
+                    rate_limited += 1
+                    if rate_limited >= FETCH_RETRIES:
+                        raise
                     self.logger.debug(
                         f"Formsite API fetch reached RateLimitException | waiting {HTTP_429_WAIT_DELAY} seconds"
                     )
@@ -92,15 +131,17 @@ class FormFetcher:
         """
         api_params = self.params.as_dict()
         api_params["page"] = page
-        try:
-            with session.get(self.url_results, params=api_params) as resp: # type: ignore
-                return resp
-        except requests_ConnectionError:
-            self.logger.critical(
-                f"API Fetch {self.form_id}: Target refused connection, waiting and retrying"
-            )
-            sleep(ConnectionError_DELAY)
-            return self.fetch_result(page, session)
+        for attempt in range(FETCH_RETRIES):
+            try:
+                with session.get(self.url_results, params=api_params) as resp: # type: ignore
+                    return resp
+            except requests_ConnectionError:
+                if attempt == FETCH_RETRIES - 1:
+                    raise
+                self.logger.critical(
+                    f"API Fetch {self.form_id}: Target refused connection, waiting and retrying"
+                )
+                sleep(ConnectionError_DELAY)
 
     def fetch_items(self, results_labels_id: int = None) -> dict:
         """Fetches form items
@@ -111,8 +152,7 @@ class FormFetcher:
         Returns:
             dict: Formsite form's items dictionary
         """
-        with Session() as session:
-            session.headers.update(self.auth_header)
+        with self._session_scope() as session:
             params = (
                 {"results_labels": results_labels_id}
                 if results_labels_id is not None
@@ -120,7 +160,7 @@ class FormFetcher:
             )
             with session.get(self.url_items, params=params) as resp:
                 self.handle_response(resp)
-                return resp.json()
+                return json_loads(resp.content)
 
     @staticmethod
     def handle_response(response: Response):
@@ -1,12 +1,18 @@
 """Defines the FormParser object and its logic."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from itertools import chain
 import re
-from typing import List
+from typing import Iterable, List, Optional
 import pandas as pd
 
 from formsite_util._logger import FormsiteLogger
-from formsite_util.consts import METADATA_COLS
+from formsite_util.consts import DATE_COLS, METADATA_COLS
+
+CHILDREN_ITEM_RE = re.compile(r"(\d+?-\d+?-\d+?)")
+# Below this many pages, process pool startup costs more than it saves
+PARALLEL_MIN_PAGES = 4
 
 
 def _parse_item(item: dict):
@@ -19,10 +25,49 @@ def _parse_item(item: dict):
     return value
 
 
-def _parse_date_col_inplace(df: pd.DataFrame, col: str):
-    """Tries to parse date column (string to datetime) inplace"""
-    if col in df.columns:
-        df[col] = pd.to_datetime(df[col], errors="raise")
+@lru_cache(maxsize=4096)
+def _parent_item_key(key: str) -> Optional[str]:
+    """Column a children item (x-y-z) is merged into, None for other items. Cached, ids repeat on every row"""
+    if CHILDREN_ITEM_RE.match(key) is None:
+        return None
+    s = key.split("-")
+    return f"{s[0]}-{s[-1]}"
+
+
+def _parse_results_items(items: dict) -> dict:
+    """Parses ['items'] dictionary of the result"""
+    parsed = {}
+    for item in items:
+        key = item["id"]
+        val = _parse_item(item)
+        parent_key = _parent_item_key(key)
+        if parent_key is not None:
+            if parent_key not in parsed:
+                parsed[parent_key] = val
+            else:
+                parsed[parent_key] = f"{parsed[parent_key]} | {val}"
+        else:
+            parsed[key] = val
+    return parsed
+
+
+def _parse_page(results: dict) -> List[dict]:
+    """Parses 1 Formsite results dictionary into a list of row records (picklable for process pools)"""
+    mdc = set(METADATA_COLS.keys())
+    rows = []
+    for record in results["results"]:
+        keyset = set(record.keys())
+        metadata = {i: record.get(i) for i in keyset.intersection(mdc)}
+        items = _parse_results_items(record.get("items", {}))
+        rows.append(dict(**metadata, **items))
+    return rows
+
+
+def _parse_date_cols_inplace(df: pd.DataFrame):
+    """Tries to parse all present date columns (string to datetime) inplace"""
+    for col in df.columns.intersection(DATE_COLS):
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors="raise")
 
 
 def _order_df_cols(df: pd.DataFrame):
@@ -49,44 +94,41 @@ class FormParser:
 
     def __init__(self) -> None:
         self.data: List[dict] = []
-        self.children_item_re = re.compile(r"(\d+?-\d+?-\d+?)")
+        self.children_item_re = CHILDREN_ITEM_RE
         self.logger: FormsiteLogger = FormsiteLogger()
 
     def parse_results_items(self, items: dict) -> dict:
         """Parses ['items'] dictionary of the result"""
-        parsed = {}
-        for item in items:
-            key = item["id"]
-            val = _parse_item(item)
-            if self.children_item_re.match(key) is not None:
-                s = key.split("-")
-                parent_key = f"{s[0]}-{s[-1]}"
-                if parent_key not in parsed:
-                    parsed[parent_key] = val
-                else:
-                    parsed[parent_key] = f"{parsed[parent_key]} | {val}"
-            else:
-                parsed[key] = val
-        # self.logger.debug(f"Form Parser: Parsed {len(parsed)} item columns")
-        return parsed
+        return _parse_results_items(items)
 
     def feed(self, results: dict) -> None:
         """Parses 1 Formsite results dictionary, appends it to processed data"""
-        mdc = set(METADATA_COLS.keys())
-        for record in results["results"]:
-            keyset = set(record.keys())
-            metadata = {i: record.get(i) for i in keyset.intersection(mdc)}
-            items = self.parse_results_items(record.get("items", {}))
-            self.data.append(dict(**metadata, **items))
+        self.data.extend(_parse_page(results))
+
+    def feed_pages_parallel(
+        self, pages: Iterable[dict], workers: Optional[int] = None
+    ) -> None:
+        """Parses many Formsite results dictionaries across processes, appends them to processed data in input order
+
+        Args:
+            pages (Iterable[dict]): Formsite results dictionaries (1 per API page)
+            workers (int, optional): Number of worker processes. Defaults to None (number of CPUs).
+        """
+        page_batch = list(pages)
+        if len(page_batch) < PARALLEL_MIN_PAGES:
+            for page in page_batch:
+                self.feed(page)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rows in executor.map(_parse_page, page_batch):
+                self.data.extend(rows)
 
     def as_dataframe(self) -> pd.DataFrame:
         """Return data fed into the parser so far as a Pandas DataFrame"""
         df = pd.DataFrame(self.data)
         if not df.empty:
             df = _order_df_cols(df)
-            _parse_date_col_inplace(df, "date_update")
-            _parse_date_col_inplace(df, "date_start")
-            _parse_date_col_inplace(df, "date_finish")
+            _parse_date_cols_inplace(df)
         return df
 
     def as_records(self) -> List[dict]:
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Union
 import pandas as pd
 from requests import Session
-from formsite_util._form_fetcher import FormFetcher
+from formsite_util._form_fetcher import FormFetcher, json_loads
 from formsite_util._logger import FormsiteLogger
 
 
@@ -70,7 +70,7 @@ class FormsiteFormsList:
 
             with session.get(self.url_forms) as resp:
                 FormFetcher.handle_response(resp)
-                data = resp.json()
+                data = json_loads(resp.content)
 
         self.data = self.parse(data)
 
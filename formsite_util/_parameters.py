@@ -10,21 +10,19 @@ import pytz
 from formsite_util.error import InvalidDateFormatExpection
 
 
+DATE_FORMATS = ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S")
+
+
 def try_parse_date(date: Union[dt, str]) -> dt:
     """Attempts to parse a date string from various allowed formats int tz=utc datetime"""
-    formats = ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]
-    i = 0
-    while not isinstance(date, dt):
+    if isinstance(date, dt):
+        return date
+    for fmt in DATE_FORMATS:
         try:
-            date = dt.strptime(date, formats[i])
-            break
-        except IndexError as ex:
-            raise InvalidDateFormatExpection(date) from ex
+            return dt.strptime(date, fmt)
         except ValueError:
-            pass
-        finally:
-            i += 1
-    return date
+            continue
+    raise InvalidDateFormatExpection(date)
 
 
 def shift_date_from_tz_to_utc(date: dt, tz: str) -> dt:
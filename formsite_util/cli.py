@@ -12,11 +12,13 @@ from tqdm.auto import tqdm
 
 # ----
 from formsite_util._form import FormsiteForm, FormCallback
+from formsite_util._form_data import strftime_date_cols
+from formsite_util.error import FormsiteNoResultsException
 from formsite_util._list import FormsiteFormsList
 from formsite_util._parameters import FormsiteParameters
 from formsite_util._logger import FormsiteLogger
 from formsite_util.consts import QUOTE, LINE_TERM, TIMESTAMP
-from formsite_util.__init__ import __version__
+from formsite_util import __version__
 
 _FETCH_PBAR: Optional[tqdm] = None
 _DOWNLOAD_PBAR: Optional[tqdm] = None
@@ -70,9 +72,12 @@ def main():
         sys.exit(0)
     # ----
     form = FormsiteForm(args.form, args.token, args.server, args.directory)
+    after_id = args.afterref
+    if args.incremental is not None and after_id is None:
+        after_id = load_latest_id(args)
     params = FormsiteParameters(
         last=args.last,
-        after_id=args.afterref,
+        after_id=after_id,
         before_id=args.beforeref,
         after_date=args.afterdate,
         before_date=args.beforedate,
@@ -81,13 +86,22 @@ def main():
         sort=args.sort,
     )
     if not args.disable_progressbars:
-        _FETCH_PBAR = tqdm(desc=f"Exporting {args.form}")
-    form.fetch(
-        params=params,
-        fetch_callback=fetch_pbar_callback,
-    )
-    if not args.disable_progressbars:
-        _FETCH_PBAR.close()
+        _FETCH_PBAR = tqdm(desc=f"Exporting {args.form}", mininterval=0.5)
+    try:
+        form.fetch(
+            params=params,
+            result_labels_id=args.resultslabels,
+            fetch_callback=fetch_pbar_callback,
+            cache_items_path=items_cache_path(args),
+        )
+    except FormsiteNoResultsException:
+        if args.incremental is None or after_id is None:
+            raise
+        print(f"No new results after Reference # {after_id}")
+        sys.exit(0)
+    finally:
+        if not args.disable_progressbars:
+            _FETCH_PBAR.close()
     # ----
     if args.output is not None:
         save_output(args, form)
@@ -96,24 +110,35 @@ def main():
     if args.extract is not None:
         save_extract(args, form)
     if args.download is not None:
-        loop = asyncio.get_event_loop()
         if not args.disable_progressbars:
-            _DOWNLOAD_PBAR = tqdm(desc=f"Downloading from {args.form}")
-        save_download(args, form, loop)
+            _DOWNLOAD_PBAR = tqdm(desc=f"Downloading from {args.form}", mininterval=0.5)
+        save_download(args, form)
         if not args.disable_progressbars:
             _DOWNLOAD_PBAR.close()
     # ----
 
 
+def items_cache_path(args: Namespace) -> Optional[str]:
+    """Resolve where form items are cached between runs (if enabled)"""
+
+    if args.cache_items is None:
+        return None
+    labels = f"_{args.resultslabels}" if args.resultslabels is not None else ""
+    return output_path(args.cache_items, f"./items_{args.form}{labels}.json")
+
+
+def output_path(path: str, default: str) -> str:
+    """Resolve an output path (or its default if empty) and create its parent directory"""
+
+    resolved = Path(path or default).resolve()
+    os.makedirs(resolved.parent.as_posix(), exist_ok=True)
+    return resolved.as_posix()
+
+
 def save_output(args: Namespace, form: FormsiteForm):
     """Save file based on extension."""
     # Supported (.csv|.xlsx|.pickle|.parquet|.feather|.hdf)
-    if not args.output:
-        path = Path(f"./export_{form.form_id}_{TIMESTAMP}.csv").resolve()
-    else:
-        path = Path(args.output).resolve()
-    os.makedirs(path.parent.as_posix(), exist_ok=True)
-    str_path = path.as_posix()
+    str_path = output_path(args.output, f"./export_{form.form_id}_{TIMESTAMP}.csv")
     ext = str_path.rsplit(".", 1)[-1].lower()
     df = form.results_labels if args.use_items else form.results
     if df is None:
@@ -131,11 +156,12 @@ def save_output(args: Namespace, form: FormsiteForm):
         df.to_hdf(str_path, key=form.form_id)
     # Default to CSV
     else:
+        if args.date_format is not None:
+            df = strftime_date_cols(df, args.date_format)
         df.to_csv(
             str_path,
             encoding=args.encoding,
             index=False,
-            date_format=args.date_format,
             line_terminator=LINE_TERM.get(
                 args.line_terminator, LINE_TERM.get("os_default")
             ),
@@ -144,40 +170,46 @@ def save_output(args: Namespace, form: FormsiteForm):
         )
 
 
+def latest_id_path(path: str) -> str:
+    """Resolve the latest Reference # file, defaulting to latest_ref.txt"""
+
+    return Path(path or "./latest_ref.txt").resolve().as_posix()
+
+
+def load_latest_id(args: Namespace) -> Optional[int]:
+    """Read the Reference # stored by a previous run (if there is one)"""
+
+    path = latest_id_path(args.incremental or args.latest_id)
+    try:
+        with open(path, "r", encoding="utf-8") as fp:
+            return int(fp.read().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
 def save_latest_id(args: Namespace, form: FormsiteForm):
     """Write latest Reference # to a file (if it exists)"""
 
     if "id" in form.results.columns:
-        m = max(form.results["id"])
-        with open(args.latest_id, "w", encoding="utf-8") as fp:
+        m = form.results["id"].max()
+        with open(latest_id_path(args.latest_id), "w", encoding="utf-8") as fp:
             fp.write(f"{m}\n")
 
 
 def save_extract(args: Namespace, form: FormsiteForm):
     """Extract all URLs from the FileUpload controls and save them to a file"""
 
-    if not args.extract:
-        path = Path(f"./url_{form.form_id}_{TIMESTAMP}.txt").resolve()
-    else:
-        path = Path(args.extract).resolve()
-    os.makedirs(path.parent.as_posix(), exist_ok=True)
-    str_path = path.as_posix()
+    str_path = output_path(args.extract, f"./url_{form.form_id}_{TIMESTAMP}.txt")
     URLs = form.extract_urls(args.extract_regex)
     with open(str_path, "w", encoding="utf-8") as fp:
         for url in URLs:
             fp.write(f"{url}\n")
 
 
-def save_download(args: Namespace, form: FormsiteForm, loop: asyncio.AbstractEventLoop):
+def save_download(args: Namespace, form: FormsiteForm):
     """Download all files uploaded to the form using the File Upload control"""
 
-    if not args.download:
-        path = Path(f"./download_{form.form_id}_{TIMESTAMP}").resolve()
-    else:
-        path = Path(args.download).resolve()
-    # ----
-    os.makedirs(path.parent.as_posix(), exist_ok=True)
-    str_path = path.as_posix()
+    str_path = output_path(args.download, f"./download_{form.form_id}_{TIMESTAMP}")
     download = form.async_downloader(
         str_path,
         max_concurrent=args.concurrent_downloads,
@@ -190,7 +222,7 @@ def save_download(args: Namespace, form: FormsiteForm, loop: asyncio.AbstractEve
         callback=download_pbar_callback,
     )
     # ----
-    loop.run_until_complete(download.run())
+    asyncio.run(download.run())
 
 
 def fetch_pbar_callback(page: int, total_pages: int, data: dict) -> None:
@@ -339,6 +371,17 @@ def get_args() -> Namespace:
         help="Use specific results labels for your CSV headers.\n"
         "Defaults to default Question labels.",
     )
+    g_params_i.add_argument(
+        "--cache_items",
+        nargs="?",
+        default=None,
+        metavar="PATH/TO/FILE",
+        const="",
+        help="Store form items (column labels) in a json file and reuse them on later runs\n"
+        "instead of fetching them again. They are re-fetched if the results contain\n"
+        "columns the stored items do not know about.\n"
+        "Defaults to items_formID.json in the folder of the script.",
+    )
     g_params_r.add_argument(
         "--resultsview",
         type=int,
@@ -462,6 +505,17 @@ def get_args() -> Namespace:
         "\nIf there are no results in your export, nothing will happen."
         "\nYou may also specify an output file, `-S output_file.txt",
     )
+    g_other.add_argument(
+        "-I",
+        "--incremental",
+        nargs="?",
+        metavar="PATH/TO/FILE",
+        default=None,
+        const="",
+        help="Only export results newer than the Reference # stored by a previous run with -S."
+        "\nReads the file given here, otherwise the -S file, otherwise `latest_ref.txt`."
+        "\nIgnored if -aID is given. Combine with -S to keep the stored Reference # up to date.",
+    )
     g_extract.add_argument(
         "-xre",
         "--extract_regex",
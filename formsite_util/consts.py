@@ -22,8 +22,14 @@ METADATA_COLS = {
     "user_referrer": "Referrer",
 }
 
+# Metadata columns that hold ISO 8601 datetime strings
+DATE_COLS = ("date_update", "date_start", "date_finish")
+
 HTTP_429_WAIT_DELAY = 60  # seconds
 ConnectionError_DELAY = 10  # seconds
+FETCH_RETRIES = 8  # attempts per API call before the last error is raised
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes read per iteration when streaming a file
+DOWNLOAD_WRITE_BUFFER_SIZE = 1024 * 1024  # bytes collected before each write to disk
 
 QUOTE = {
     "QUOTE_ALL": QUOTE_ALL,
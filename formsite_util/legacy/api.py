@@ -4,8 +4,9 @@ api.py
 This module contains a class that handles API requests to Formsite API.
 """
 from __future__ import annotations
-from typing import List, Tuple, Any
+from typing import List, Optional, Tuple, Any
 from dataclasses import dataclass
+import sys
 import time
 import requests
 from requests.exceptions import HTTPError
@@ -13,6 +14,13 @@ from tqdm import tqdm
 
 from .auth import FormsiteCredentials
 
+try:  # orjson is an optional, faster drop-in for decoding large result pages
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+RATE_LIMIT_RETRIES = 8  # attempts per API call before a HTTP 429 or 5xx is raised
+
 
 @dataclass
 class _FormsiteAPI:
@@ -26,9 +34,11 @@ class _FormsiteAPI:
         form_id (str): ID of form to fetch.
         params (FormsiteParams): An instance of FormsiteParams class.
         auth (FormsiteCredentials): An instance of FormsiteCredentials class.
-        display_progress (bool): Display progress using tqdm. Defaults to True.
+        display_progress (bool): Display progress using tqdm, only when stderr is a terminal. Defaults to True.
         delay (float | int): Delay in seconds between each API call. Defaults to 5.
         long_delay (float | int): Delay in seconds between each API call after page 3. Defaults to 15.
+            Both delays are stretched (up to 8x) after a HTTP 429 response and relax back as calls succeed.
+        session (requests.Session, optional): Reuse an existing session (keep-alive connection pool). Defaults to None (creates its own).
 
     Raises:
         Exception: General uncaught exception.
@@ -44,6 +54,7 @@ class _FormsiteAPI:
     display_progress: bool = True
     short_delay: float = 5.0
     long_delay: float = 15.0
+    session: Optional[requests.Session] = None
 
     def __post_init__(self):
         """Generates post_init internal variables."""
@@ -54,7 +65,10 @@ class _FormsiteAPI:
         self.items_url: str = f"{self.url_base}/forms/{self.form_id}/items"
         self.total_pages: int = 1
         self.check_pages: bool = True
-        self.pbar = (
+        self.last_request_time: Optional[float] = None
+        self.delay_factor: float = 1.0
+        self.display_progress = self.display_progress and sys.stderr.isatty()
+        self.pbar: Optional[tqdm] = (
             tqdm(
                 desc="Starting API requests",
                 total=2,
@@ -62,27 +76,32 @@ class _FormsiteAPI:
                 leave=False,
                 dynamic_ncols=True,
                 ncols=80,
+                mininterval=0.5,
             )
             if self.display_progress
             else None
         )
-        self.session = None
         self.params_dict = self.params.get_params_as_dict()
         self.items_dict = self.params.get_items_as_dict()
 
     def Start(self, get_items: bool, get_results: bool) -> Tuple[dict, List[dict]]:
         """Performs all API calls to formsite servers asynchronously"""
         items, results = (None, [])
-        with requests.session() as self.session:
+        owns_session = self.session is None
+        if owns_session:
+            self.session = requests.session()
+        try:
             self.session.headers.update(self.auth.get_auth_header())
             results = self.get_results() if get_results else []
             items = self.fetch_items() if get_items else None
             self._update_pbar_progress()
             self._update_pbar_desc(desc="API calls complete")
-            try:
+            if self.pbar is not None:
                 self.pbar.close()
-            except AttributeError:
-                pass
+        finally:
+            if owns_session:
+                self.session.close()
+                self.session = None
         return items, results
 
     def get_results(self) -> List[dict]:
@@ -136,60 +155,80 @@ class _FormsiteAPI:
 
     def fetch_results(self, params: dict, page: int) -> dict:
         """Handles fetching and writing (if selected) of results json."""
-        self._update_pbar_desc(desc=f"Fetching rows ({(page-1)*500}-{page*500})")
         return self.fetch_content(self.results_url, params, page=page)
 
     def fetch_content(self, url: str, params: dict, page: int = None) -> dict:
         """Base method for interacting with the formsite api with aiohttp GET request. Returns content of the response."""
         if page is not None:
-            params["page"] = page
-            if page > 3:
+            params = {**params, "page": page}
+        for attempt in range(RATE_LIMIT_RETRIES):
+            delay = self.delay_factor * (
+                self.long_delay if page is not None and page > 3 else self.short_delay
+            )
+            if page is not None:
                 self._update_pbar_desc(
-                    desc=f"Delay [{self.long_delay:0.0f} s] ({(page-1)*500}-{page*500})"
+                    desc=f"Delay [{delay:0.0f} s] ({(page-1)*500}-{page*500})"
                 )
-                time.sleep(max(self.long_delay - self.short_delay, 0))
+            self._wait_since_last_request(delay)
+            with self.session.get(url, params=params) as response:
+                status = response.status_code
+            if status == 429:
+                # back off: honour Retry-After and space out the following calls
+                wait = self._retry_after(response)
+                self.delay_factor = min(self.delay_factor * 2, 8.0)
+                desc = f"Reached rate limit, waiting {wait:0.0f} seconds"
+            elif status >= 500:
+                wait = self._retry_after(response, default=min(2.0**attempt, 60.0))
+                desc = f"[HTTP ERROR {status}] retrying in {wait:0.0f} seconds"
             else:
-                self._update_pbar_desc(
-                    desc=f"Delay [{self.short_delay:0.0f} s] ({(page-1)*500}-{page*500})"
-                )
-        time.sleep(self.short_delay)
-        with self.session.get(url, params=params) as response:
-            content = response.json()
-            if response.status_code != 200:
-                previous_desc = self.pbar.desc
-                self._update_pbar_desc(desc=f"Error: [{response.status_code}]")
-                if response.status_code == 429:
-                    self._update_pbar_desc(desc="Reached rate limit, waiting 60 seconds")
-                    time.sleep(60)
-                    self._update_pbar_desc(desc=previous_desc)
-                    content = self.fetch_content(url, params, page=page)
-                else:
-                    err_message = f"[HTTP ERROR {response.status_code}] {response.text} for url '{response.url}'"
-                    raise HTTPError(response, err_message)
-            if self.check_pages and page is not None:
-                self.total_pages = int(response.headers["Pagination-Page-Last"])
-                self.check_pages = False
-                try:
-                    self._update_pbar_total(self.total_pages)
-                except AttributeError as ex:
-                    # print(ex)
-                    pass
+                break
+            if attempt == RATE_LIMIT_RETRIES - 1:
+                break  # no point waiting before raising
+            self._update_pbar_desc(desc=desc)
+            time.sleep(wait)
+        if response.status_code != 200:
+            err_message = f"[HTTP ERROR {response.status_code}] {response.text} for url '{response.url}'"
+            raise HTTPError(response, err_message)
+        # ease back towards the configured delays while the server keeps up
+        self.delay_factor = max(self.delay_factor * 0.9, 1.0)
+        content = json_loads(response.content)
+        if self.check_pages and page is not None:
+            self.total_pages = int(
+                response.headers.get("Pagination-Page-Last", self.total_pages)
+            )
+            self.check_pages = False
+            self._update_pbar_total(self.total_pages)
         self._update_pbar_progress()
         return content
 
+    def _wait_since_last_request(self, delay: float) -> None:
+        """Sleeps until at least `delay` seconds passed since the previous request was sent."""
+        now = time.monotonic()
+        if self.last_request_time is not None:
+            time.sleep(max(delay - (now - self.last_request_time), 0))
+        self.last_request_time = time.monotonic()
+
+    @staticmethod
+    def _retry_after(response: requests.Response, default: float = 60.0) -> float:
+        """Seconds to wait according to the Retry-After header, `default` if it is missing or not a number."""
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return default
+
     def fetch_items(self) -> dict:
         """Handles fetching and writing (if selected) of items json."""
         self._update_pbar_desc(desc="Fetching headers")
         return self.fetch_content(self.items_url, self.items_dict)
 
     def _update_pbar_total(self, n: int) -> None:
-        if isinstance(self.pbar, tqdm):
+        if self.pbar is not None:
             self.pbar.total = n # type: ignore
 
     def _update_pbar_progress(self) -> None:
-        if isinstance(self.pbar, tqdm):
+        if self.pbar is not None:
             self.pbar.update(1)
 
     def _update_pbar_desc(self, desc: str) -> None:
-        if isinstance(self.pbar, tqdm):
+        if self.pbar is not None:
             self.pbar.set_description(desc=desc, refresh=True) # type: ignore
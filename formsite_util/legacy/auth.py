@@ -4,22 +4,9 @@ Raises:
 """
 
 from dataclasses import dataclass
-from typing import Dict
 
-
-def _sanitize_argument(argument: str, chars2remove: Dict[str, str]) -> str:
-    """Performs a find and replace on 'argument' based on mapping in chars2remove.
-
-    Args:
-        argument (str): text to perform find and replace on
-        chars2remove (List[str]): mapping of {find:replace}
-
-    Returns:
-        str: sanitized argument
-    """
-    for key, value in chars2remove.items():
-        argument = str(argument).replace(key, value)
-    return argument
+# strips single and double quotes in one pass
+_QUOTES_TABLE = str.maketrans("", "", "'\"")
 
 
 def _confirm_arg_format(arg_value: str, arg_name: str, flag: str, example: str) -> str:
@@ -37,14 +24,12 @@ def _confirm_arg_format(arg_value: str, arg_name: str, flag: str, example: str)
     Returns:
         str: the sanitized (quote-less) argument back
     """
-    quotes_map = {"'": "", '"': ""}
     if not isinstance(arg_value, str):
         raise ValueError(
             f"invalid format for argument {arg_value}, {arg_name}, "
             f"correct example: {flag} {example}"
         )
-    arg_value = _sanitize_argument(arg_value, quotes_map)
-    return arg_value
+    return arg_value.translate(_QUOTES_TABLE)
 
 
 @dataclass
@@ -2,16 +2,16 @@
 downloader.py
 
 this module contains the functionality for downloading downloading
-many urls concurrently with a worker queue+semaphore asyncio approach
+many urls concurrently with a worker queue asyncio approach
 """
 from __future__ import annotations
 import os
 import re
-from pathlib import Path
 import asyncio
 import shutil
+from collections import deque
 from time import perf_counter
-from typing import Callable, Iterable, Optional, Set, Tuple
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from tqdm import tqdm
 from aiohttp import (
@@ -22,6 +22,8 @@ from aiohttp import (
     InvalidURL,
 )
 
+_FS_PREFIX_RE = re.compile(r"^f-[\d]*-[\d]*-")
+
 
 @dataclass
 class _FormsiteDownloader:
@@ -43,14 +45,13 @@ class _FormsiteDownloader:
     def __post_init__(self):
         """Initializes internal variables."""
         self.filename_compiled_regex = re.compile(self.filename_regex)
-        self.semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
-        self.dl_queue = asyncio.Queue()
         if not self.overwrite_existing and len(self.links) > 0:
-            for element in self.links:
-                url = element.rsplit("/", 1)[0] + "/"
-                break
-            filenames_in_dl_dir = self._list_files_in_download_dir(url)
-            self.links = set(self.links) - filenames_in_dl_dir
+            filenames_in_dl_dir = self._list_files_in_download_dir()
+            self.links = {
+                link
+                for link in self.links
+                if link.rsplit("/", 1)[-1] not in filenames_in_dl_dir
+            }
         else:
             self.links = set(self.links)
         self.internal_state = DownloadWorkerState(
@@ -67,45 +68,49 @@ class _FormsiteDownloader:
                 leave=False,
                 dynamic_ncols=True,
                 ncols=80,
+                mininterval=0.5,
             )
             if self.display_progress
             else None
         )
         os.makedirs(self.download_folder, exist_ok=True)
-        async with ClientSession(connector=TCPConnector(limit=0)) as session:
+        self.internal_state.taken_targets.update(
+            f"{self.download_folder}/{file}" for file in self._list_files_in_download_dir()
+        )
+        self.dl_queue: Deque[Tuple[str, int]] = deque()
+        connector = TCPConnector(limit=self.max_concurrent_downloads, ttl_dns_cache=300)
+        async with ClientSession(connector=connector) as session:
             self.internal_state.update_pbar_callback = pbar.update if pbar else None
-            for link in self.links:
-                self.dl_queue.put_nowait((link, 0))
+            self.dl_queue.extend((link, 0) for link in self.links)
             tasks = [
-                asyncio.ensure_future(
+                asyncio.create_task(
                     DownloadWorker(
                         self.download_folder,
                         self.dl_queue,
-                        self.semaphore,
                         session,
                         self.internal_state,
                         timeout=self.timeout,
                         retries=self.retries,
                         pbar=pbar,
-                        filename_regex=self.filename_regex,
+                        filename_regex=self.filename_compiled_regex,
                         strip_prefix=self.strip_prefix,
                     ).main()
                 )
                 for _ in range(self.max_concurrent_downloads)
             ]
-            await asyncio.gather(*tasks)
+            await asyncio.wait(tasks)
+            for task in tasks:
+                task.result()  # re-raise worker errors like gather() did
         pbar.close() if pbar else None
         if self.internal_state.failed > 0 and self.write_failed:
             self.internal_state.write_failed()
         if self.report_downloads:
             self.internal_state.write_all()
 
-    def _list_files_in_download_dir(self, url: str) -> Set[str]:
-        """Lists all files in `self.download_folder`, inserts `url` before the filename."""
-        filenames_in_dir = set()
-        for file in os.listdir(self.download_folder):
-            filenames_in_dir.add(url + file)
-        return filenames_in_dir
+    def _list_files_in_download_dir(self) -> Set[str]:
+        """Lists names of all entries in `self.download_folder`."""
+        with os.scandir(self.download_folder) as entries:
+            return {entry.name for entry in entries}
 
 
 @dataclass
@@ -127,7 +132,10 @@ class DownloadWorkerState:
         self.success_urls: set = set()
         self.complete_urls: list = list()
         self.update_pbar_callback: Optional[Callable] = None
+        # perf_counter() of the last status message shown in the pbar, 0 when none
         self.last_progress_display_update = 0
+        self.taken_targets: Set[str] = set()
+        self.url_targets: Dict[str, str] = {}
 
     def total_complete(self):
         """Returns sum of `self.success` and `self.failed`"""
@@ -180,17 +188,18 @@ class DownloadWorkerState:
 
     def mark_success(self, url: str) -> None:
         """Increments internal counter to match completed downloads."""
-        self._mark(url, "OK", self.success_urls, self.success)
+        self.success += 1
+        self._mark(url, "OK", self.success_urls)
 
     def mark_fail(self, url: str, fail_exception: Exception) -> None:
         """Increments internal counter to match completed downloads."""
-        self._mark(url, repr(fail_exception), self.failed_urls, self.failed)
+        self.failed += 1
+        self._mark(url, repr(fail_exception), self.failed_urls)
 
-    def _mark(self, url: str, status: str, add_to: Set[str], count_to: int):
-        """Base method for changing internal state counts."""
+    def _mark(self, url: str, status: str, add_to: Set[str]):
+        """Base method for recording a completed download."""
         self.complete_urls.append(f"{url};\t{status}")
         add_to.add(f"{url}")
-        count_to += 1
         if self.update_pbar_callback is not None:
             self.update_pbar_callback(1)
 
@@ -212,18 +221,17 @@ class DownloadWorkerState:
 class DownloadWorker:
 
     """download_folder is a path to download directory,
-    \nqueue, semaphore, session, internal state and pbar are shared across all workers
+    \nqueue, session, internal state and pbar are shared across all workers
     """
 
     download_folder: str
-    queue: asyncio.Queue
-    semaphore: asyncio.Semaphore
+    queue: Deque[Tuple[str, int]]
     session: ClientSession
     internal_state: DownloadWorkerState
     timeout: int = 80
     retries: int = 1
     pbar: Optional[tqdm] = None
-    filename_regex: str = r""
+    filename_regex: Union[str, re.Pattern] = r""
     strip_prefix: bool = False
 
     def __post_init__(self):
@@ -237,13 +245,12 @@ class DownloadWorker:
             try:
                 if self.internal_state.can_terminate_worker():
                     break
-                url, attempt = await self.queue.get()
-                await self.semaphore.acquire()
-                if (
-                    abs(self.internal_state.last_progress_display_update - perf_counter())
-                    > 5
-                ):  # seconds
+                url, attempt = self.queue.popleft()  # enqueued > 0 here
+                # Only read the clock while a status message is being displayed
+                last_update = self.internal_state.last_progress_display_update
+                if last_update and perf_counter() - last_update > 5:  # seconds
                     self._update_pbar(desc="Downloading files")
+                    self.internal_state.last_progress_display_update = 0
                 self.internal_state.start_iteration()
                 try:
                     response = await self._download(url)
@@ -254,7 +261,6 @@ class DownloadWorker:
             except asyncio.CancelledError:
                 pass
             finally:
-                self.semaphore.release()
                 self.internal_state.end_iteration()
         return 0
 
@@ -263,13 +269,15 @@ class DownloadWorker:
         url: str,
         filename: str,
         target: str,
-        chunk_size: int = 4 * 1024,
+        chunk_size: int = 64 * 1024,
+        write_buffer_size: int = 1024 * 1024,
         in_progress_ext: str = ".tmp",
     ) -> int:
         """The core download function with `session.get` request."""
         display_name = (
             filename[:20] + "…" + filename[-5:] if len(filename) > 25 else filename[:25]
         )
+        loop = asyncio.get_running_loop()
         async with self.session.get(url, timeout=self.client_timeout) as response:
             response.raise_for_status()
             pbar: Optional[tqdm] = (
@@ -281,17 +289,29 @@ class DownloadWorker:
                     unit_scale=True,
                     unit_divisor=1024,
                     ncols=80,
+                    mininterval=0.5,
                 )
                 if self.display_progress
                 else None
             )
-            with open(target + in_progress_ext, "wb") as f:
+            # file io goes through the executor, chunks are written in batches
+            f = await loop.run_in_executor(None, open, target + in_progress_ext, "wb")
+            try:
+                buffer: List[bytes] = []
+                buffered = 0
                 async for chunk in response.content.iter_chunked(chunk_size):
-                    f.write(chunk)
+                    buffer.append(chunk)
+                    buffered += len(chunk)
+                    if buffered >= write_buffer_size:
+                        await loop.run_in_executor(None, f.writelines, buffer)
+                        buffer, buffered = [], 0
                     pbar.update(len(chunk)) if pbar else None
+                await loop.run_in_executor(None, f.writelines, buffer)
+            finally:
+                await loop.run_in_executor(None, f.close)
 
         pbar.close() if pbar else None
-        shutil.move(target + in_progress_ext, target)
+        await loop.run_in_executor(None, shutil.move, target + in_progress_ext, target)
         return 0
 
     async def _download(self, url: str) -> int:
@@ -330,40 +350,37 @@ class DownloadWorker:
         self.internal_state.last_progress_display_update = perf_counter()
         attempt += 1
         self.internal_state.enqueued += 1
-        self.queue.put_nowait((url, attempt))
+        self.queue.append((url, attempt))
 
     def _update_pbar(self, desc: str = ""):
         """Updates main download progress bar with a provided description."""
-        if isinstance(self.pbar, tqdm):
+        if self.pbar is not None:
             self.pbar.set_description(desc=desc, refresh=True) # type: ignore
 
     def get_filename(self, url: str) -> Tuple[str, str]:
         """Gets filename from url. Returns filename and path+filename as target."""
         filename = f"{url.split('/')[-1:][0]}"
         if self.strip_prefix:
-            filename = re.sub(r"^f-[\d]*-[\d]*-", r"", filename)
+            filename = _FS_PREFIX_RE.sub("", filename)
         if self.filename_compiled_regex.pattern != "":
             filename = self._regex_substitution(filename, self.filename_compiled_regex)
-            target = f"{self.download_folder}/{filename}"
-            target = self._check_if_file_exists(target)
+            target = self.internal_state.url_targets.get(url)
+            if target is None:
+                target = self._check_if_file_exists(f"{self.download_folder}/{filename}")
+                self.internal_state.url_targets[url] = target
         else:
             target = f"{self.download_folder}/{filename}"
         return filename, target
 
-    def _check_if_file_exists(self, filename: str, appended_number: int = 0) -> str:
-        """If `overwrite_downloads is False`, checks which URLs to omit based on filenames."""
-        path = Path(filename).resolve()
-        if path.exists():
-            temp = filename.rsplit(".", 1)
-            if temp[0].endswith(f"_{appended_number}"):
-                temp[0] = temp[0][: temp[0].rfind(f"_{appended_number}")]
-            try:
-                filename = temp[0] + f"_{appended_number+1}." + temp[1]
-            except IndexError:
-                filename = temp[0] + f"_{appended_number+1}"
-            filename = self._check_if_file_exists(
-                filename, appended_number=appended_number + 1
-            )
+    def _check_if_file_exists(self, filename: str) -> str:
+        """Appends `_n` to `filename` until it collides with no existing or already claimed file, then claims it."""
+        taken = self.internal_state.taken_targets
+        base, ext = os.path.splitext(filename)
+        appended_number = 0
+        while filename in taken:
+            appended_number += 1
+            filename = f"{base}_{appended_number}{ext}"
+        taken.add(filename)
         return filename
 
     def _regex_substitution(self, filename: str, filename_regex: re.Pattern) -> str:
@@ -12,18 +12,24 @@ from datetime import datetime as dt
 from datetime import timedelta as td
 from pathlib import Path
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any, Optional, Set, Union, Tuple, List
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Generator, Optional, Set, Union, Tuple, List
 import re
 import os
+import numpy as np
 import pandas as pd
 from pytz import UnknownTimeZoneError, timezone as pytztimezone
 import requests
 from .downloader import _FormsiteDownloader
 from .processing import _FormsiteProcessing
-from .api import _FormsiteAPI
+from .api import _FormsiteAPI, json_loads
 from .auth import FormsiteCredentials
-from tqdm import tqdm
+
+# parses tz database names, eg. America/Chicago
+_TZ_NAME_RE = re.compile(r"\w+/\w+")
+_FILESIZE_UNITS = ("", "K", "M", "G", "T", "P", "E")
 
 
 def _shift_param_date(date: Union[str, dt], timezone_offset: td) -> str:
@@ -43,46 +49,52 @@ def _shift_param_date(date: Union[str, dt], timezone_offset: td) -> str:
     Returns:
         str: A datetime string in 'yyyy-mm-ddTHH:MM:SSZ' format, shifted by timezone_offset amount.
     """
-    if isinstance(date, dt):
-        date = date + timezone_offset
-    else:
-        formats = ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d", "%Y-%m-%d %H:%M:%S"]
-        for f in formats:
-            try:
-                date = dt.strptime(date, f)
-                date = date + timezone_offset
-                break
-            except ValueError:
-                continue
-        if not isinstance(date, dt):
+    if not isinstance(date, dt):
+        # the separator tells the accepted formats apart, so strptime runs once
+        if "T" in date:
+            date_format = "%Y-%m-%dT%H:%M:%SZ"
+        elif " " in date:
+            date_format = "%Y-%m-%d %H:%M:%S"
+        else:
+            date_format = "%Y-%m-%d"
+        try:
+            date = dt.strptime(date, date_format)
+        except ValueError:
             raise ValueError(
                 """invalid date format input for afterdate/beforedate, please use a datetime object or string in ISO 8601, yyyy-mm-dd or yyyy-mm-dd HH:MM:SS format"""
-            )
+            ) from None
+    date = date + timezone_offset
 
     return dt.strftime(date, "%Y-%m-%dT%H:%M:%SZ")
 
 
-def _extract_timezone_from_str(timezone: str, timezone_re: str) -> td:
-    """Parses input timezone.
+@lru_cache(maxsize=32)
+def _extract_timezone_from_str(timezone: str) -> Optional[td]:
+    """Parses input timezone. Results are cached per timezone string.
 
     Args:
-        timezone (str): string in format ['+0200', '02:00', +02:00', '16:48', '-05:00', '-0600']
-        timezone_re (str): regex encompassing above mentioned valid formats
+        timezone (str): string in format ['+0200', '02:00', +02:00', '16:48', '-05:00', '-0600', '8:00', '-8:00']
 
     Returns:
-        timedelta: timedelta offset
+        timedelta: timedelta offset, None if `timezone` is not an offset
     """
-    tz_offset = None
-    if re.search(timezone_re, timezone) is not None:
-        tz_str = timezone.replace(r"\'", "").replace(r"\"", "")
-        if ":" in tz_str:
-            tz_tuple = tz_str.split(":", 1)
-        else:
-            t = len(tz_str) - 2
-            tz_tuple = (tz_str[:t], tz_str[-2:])
-
-        tz_offset = td(hours=int(tz_tuple[0]), seconds=int(tz_tuple[1]) / 60)
-    return tz_offset
+    tz_str = timezone.strip("'\"")
+    sign = -1 if tz_str[:1] == "-" else 1
+    if tz_str[:1] in ("+", "-"):
+        tz_str = tz_str[1:]
+    if ":" in tz_str:
+        hours, minutes = tz_str.split(":", 1)
+    else:
+        hours, minutes = tz_str[:-2], tz_str[-2:]
+    if not (
+        len(hours) in (1, 2)
+        and len(minutes) == 2
+        and hours.isdecimal()
+        and minutes.isdecimal()
+        and minutes < "60"
+    ):
+        return None
+    return sign * td(hours=int(hours), minutes=int(minutes))
 
 
 def _calculate_tz_offset(timezone: str) -> Tuple[td, td, dt]:
@@ -104,22 +116,11 @@ def _calculate_tz_offset(timezone: str) -> Tuple[td, td, dt]:
     if timezone == "local":
         offset_local = td(seconds=0)
     else:
-        tz_input_regex = r"(\+|\-|)([0-1]\d[0-5]\d|[0-1]\d\:[0-5]\d|\d\:[0-5]\d)"
-        # parses the following formats:
-        # America/Chicago
-        # +1200
-        # 1300
-        # -1200
-        # 8:00
-        # -8:00
-        offset_local = _extract_timezone_from_str(timezone, tz_input_regex)
+        offset_local = _extract_timezone_from_str(timezone)
 
         if offset_local is None:
-            if re.search(r"\w+/\w+", timezone) is not None:
-                off_local = pytztimezone(timezone).localize(local_date).strftime("%z")
-                t = len(off_local) - 2
-                l_inp = (off_local[:t], off_local[-2:])
-                offset_utc = td(hours=int(l_inp[0]), seconds=int(l_inp[1]) / 60)
+            if _TZ_NAME_RE.search(timezone) is not None:
+                offset_utc = pytztimezone(timezone).localize(local_date).utcoffset()
                 offset_local = offset_utc - diff_local_utc
             else:
                 raise UnknownTimeZoneError(timezone)
@@ -137,15 +138,44 @@ def _validate_path(path: str) -> str:
         str: path to a file or a folder in posix format
     """
 
-    output_file = Path(path).resolve().absolute()
-    if output_file.is_dir():
-        os.makedirs(output_file.as_posix(), exist_ok=True)
-    else:
+    output_file = Path(path).resolve()  # resolve() already returns an absolute path
+    if not output_file.is_dir():
         os.makedirs(output_file.parent.as_posix(), exist_ok=True)
 
     return output_file.as_posix()
 
 
+def _write_excel(df: pd.DataFrame, output_file: str) -> None:
+    """Streams `df` into an xlsx file using a write-only openpyxl workbook.
+
+    Datetime columns stay native Excel datetimes, formatted like `to_excel` does.
+
+    Args:
+        df (pd.DataFrame): dataframe to write
+        output_file (str): path to the output xlsx file
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    date_cols = [
+        df.columns.get_loc(col) for col in df.select_dtypes(include="datetime").columns
+    ]
+    df = df.astype(object).where(df.notna(), None)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append([str(col) for col in df.columns])
+    for row in df.itertuples(index=False, name=None):
+        if date_cols:
+            row = list(row)
+            for i in date_cols:
+                if row[i] is not None:
+                    row[i] = WriteOnlyCell(ws, value=row[i].to_pydatetime())
+                    row[i].number_format = "YYYY-MM-DD HH:MM:SS"
+        ws.append(row)
+    wb.save(output_file)
+
+
 @dataclass
 class FormsiteParams:
 
@@ -264,7 +294,7 @@ class FormsiteInterface:
 
     form_id: str
     auth: FormsiteCredentials
-    params: FormsiteParams = FormsiteParams()
+    params: FormsiteParams = field(default_factory=FormsiteParams)
     display_progress: bool = True
 
     def __post_init__(self):
@@ -277,6 +307,7 @@ class FormsiteInterface:
             `results` (List[Dict[str,str]] | list): RAW list of results jsons.
             `url_forms` (str): url for fetching info about all forms.
             `url_files` (str): url for downloading files.
+            `session` (requests.Session | None): HTTP session shared by API calls inside a `with` block.
         """
 
         self.url_forms = (
@@ -287,16 +318,40 @@ class FormsiteInterface:
         )
         self.Data = None
         self.Links = None
+        self._links_filter_re: Optional[str] = None  # filter self.Links was extracted with
         self.items = None
         self.results = []
+        self._compiled_patterns: Dict[str, re.Pattern] = {}
+        self.session: Optional[requests.Session] = None
 
     def __enter__(self):
-        """Allows use of context managers."""
+        """Allows use of context managers. API calls inside the block share one HTTP session."""
+        self.session = self._new_session()
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         """Allows use of context managers."""
-        del self
+        self.close()
+
+    def close(self) -> None:
+        """Closes the HTTP session shared by API calls of this instance, if one is open."""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def _new_session(self) -> requests.Session:
+        session = requests.session()
+        session.headers.update(self.auth.get_auth_header())
+        return session
+
+    @contextmanager
+    def _session_scope(self) -> Generator[requests.Session, None, None]:
+        """Yields the shared session if open, otherwise one that is closed after the call."""
+        if self.session is not None:
+            yield self.session
+        else:
+            with self._new_session() as session:
+                yield session
 
     def fetch_raw(
         self,
@@ -323,6 +378,7 @@ class FormsiteInterface:
             display_progress=self.display_progress,
             short_delay=short_delay,
             long_delay=long_delay,
+            session=self.session,
         )
 
         return api_handler.Start(get_items=get_items, get_results=get_results)
@@ -373,6 +429,7 @@ class FormsiteInterface:
         self.Data = self.make_dataframe(
             self.items, self.results, use_resultslabels=use_resultslabels
         )
+        self.Links = None
 
     def ReturnResults(self, column_ids_as_labels: bool = False) -> pd.DataFrame:
         """Returns pandas dataframe of results.
@@ -388,35 +445,11 @@ class FormsiteInterface:
             self.FetchResults(use_resultslabels=column_ids_as_labels)
         return self.Data
 
-    def _xtract(
-        self,
-        x: Any,
-        pattern: re.Pattern,
-        links_set: set = set(),
-        links_filter_pattern: re.Pattern = None,
-        pbar: tqdm = None,
-    ):
-        """Matches all formsite files links and appends them to links_set
-
-        Args:
-            x (Any): any element from self.Data
-            pattern (re.Pattern): formsite files link pattern
-            links_set (set, optional): output set of all links. Defaults to set().
-            links_filter_pattern (re.Pattern, optional): regex to match links. Defaults to None.
-        """
-        _ = pbar.update(1) if pbar is not None else None
-        try:
-            for url_raw in pattern.findall(x):
-                if "|" in url_raw:
-                    for part in url_raw.split(" | "):
-                        if links_filter_pattern.search(url_raw) is not None:
-                            links_set.add(part)
-                else:
-                    if links_filter_pattern.search(url_raw) is not None:
-                        links_set.add(url_raw)
-        except Exception as ex:
-            # print(ex)
-            pass
+    def _compile(self, pattern: str) -> re.Pattern:
+        """Compiles a regex pattern once per instance and reuses it on repeated calls."""
+        if pattern not in self._compiled_patterns:
+            self._compiled_patterns[pattern] = re.compile(pattern)
+        return self._compiled_patterns[pattern]
 
     def ExtractLinks(self, links_filter_re: str = r".+") -> None:
         """Stores a set of links in `self.Links` of files saved on formsite servers, that were submitted to the specified form.
@@ -427,36 +460,29 @@ class FormsiteInterface:
         if self.Data is None:
             self.FetchResults()
         links_re = fr"(https\:\/\/{self.auth.server}\.formsite\.com\/{self.auth.directory}\/files\/.*)"
-        url_pattern = re.compile(links_re)
-        filter_pattern = re.compile(links_filter_re)
-        self.Links = set()
-        if self.display_progress:
-            pbar = tqdm(desc="Extracting download links", leave=False, unit=" cells")
-        else:
-            pbar = None
-
-        _ = self.Data.applymap(
-            lambda x: self._xtract(
-                x,
-                pattern=url_pattern,
-                links_set=self.Links,
-                links_filter_pattern=filter_pattern,
-                pbar=pbar,
-            )
-        )
-        try:
-            pbar.close()
-        except AttributeError:
-            pass
-
-    def _human_friendly_filesize(self, number: int) -> str:
-        """Converts a number (filesize in bytes) to more readable filesize with units."""
-        reductions = 0
-        while number >= 1024:
-            number = number / 1024
-            reductions += 1
-        unit = {0: "", 1: "K", 2: "M", 3: "G", 4: "T", 5: "P", 6: "E"}
-        return f"{number:0.2f} {unit.get(reductions, None)}B"
+        url_pattern = self._compile(links_re)
+        # only text columns can hold links, stack() drops empty cells
+        cells = self.Data.select_dtypes(include="object").stack().astype(str)
+        urls = cells.str.findall(url_pattern).explode().dropna()
+        urls = urls.str.split(" | ", regex=False).explode()
+        if links_filter_re != r".+":  # default filter matches any non-empty link
+            filter_pattern = self._compile(links_filter_re)
+            urls = urls[urls.str.contains(filter_pattern, na=False)]
+        self.Links = set(urls)
+        self.Links.discard("")
+        self._links_filter_re = links_filter_re
+
+    def _human_friendly_filesizes(self, sizes: pd.Series) -> List[str]:
+        """Converts a column of filesizes in bytes to more readable filesizes with units."""
+        numbers = sizes.to_numpy(dtype="float64")
+        # frexp exponent - 1 is the exact floor(log2), each 10 is one reduction by 1024
+        exponents = np.frexp(np.maximum(numbers, 1))[1] - 1
+        reductions = np.clip(exponents // 10, 0, 6)
+        scaled = numbers / 1024.0 ** reductions
+        return [
+            f"{number:0.2f} {_FILESIZE_UNITS[reduction]}B"
+            for number, reduction in zip(scaled, reductions)
+        ]
 
     def _list_all_forms(self) -> pd.DataFrame:
         """Internal function that performs the API fetch, data cleanup and formatting.
@@ -464,20 +490,18 @@ class FormsiteInterface:
         Returns:
             pd.DataFrame: Cleaned DataFrame of all forms.
         """
-        with requests.get(
-            self.url_forms, headers=self.auth.get_auth_header()
-        ) as response:
+        with self._session_scope() as session, session.get(self.url_forms) as response:
             response.raise_for_status()
-            all_forms_json = response.json()["forms"]
-            # un-nest the stats object
-            for row in all_forms_json:
-                for val in row["stats"]:
-                    row[val] = row["stats"][val]
-            for row in all_forms_json:
-                for val in row["publish"]:
-                    row[val] = row["publish"][val]
-            forms_df = pd.DataFrame(
-                all_forms_json,
+            # un-nest the stats and publish objects
+            forms_df = pd.json_normalize(json_loads(response.content)["forms"])
+            forms_df = forms_df.rename(
+                columns={
+                    "stats.resultsCount": "resultsCount",
+                    "stats.filesSize": "filesSize",
+                    "publish.embed_code": "embed_code",
+                    "publish.link": "link",
+                }
+            ).reindex(
                 columns=[
                     "name",
                     "state",
@@ -486,7 +510,7 @@ class FormsiteInterface:
                     "filesSize",
                     "embed_code",
                     "link",
-                ],
+                ]
             )
             forms_df["form_id"] = forms_df.pop("directory")
             return forms_df
@@ -509,34 +533,30 @@ class FormsiteInterface:
             pd.DataFrame: Dataframe with all relevant forms data.
         """
         forms_df = self._list_all_forms()
+        if not display and save2csv is False:
+            return forms_df
+        forms_df.sort_values(
+            by=[sort_by], inplace=True, ascending=False, ignore_index=True
+        )
         if display:
             pd.set_option("display.max_rows", None)
             pd.set_option("display.max_columns", None)
             pd.set_option("display.width", None)
             pd.set_option("display.max_colwidth", 42)  # ensures width < 80 cols
             forms_df = forms_df[["name", "resultsCount", "filesSize", "form_id"]]
-            forms_df.sort_values(
-                by=[sort_by], inplace=True, ascending=False, ignore_index=True
-            )
-            forms_df.reset_index(drop=True, inplace=True)
-            forms_df = forms_df.append(
-                {
-                    "name": "Total:",
-                    "resultsCount": forms_df["resultsCount"].sum(),
-                    "filesSize": forms_df["filesSize"].sum(),
-                    "form_id": f"{forms_df.shape[0]} forms",
-                },
-                ignore_index=True,
-            )
-            forms_df["filesSize"] = forms_df["filesSize"].apply(
-                lambda x: self._human_friendly_filesize(int(x))
-            )
-            forms_df.set_index("name", inplace=True)
+            totals = {
+                "name": "Total:",
+                "resultsCount": forms_df["resultsCount"].sum(),
+                "filesSize": forms_df["filesSize"].sum(),
+                "form_id": f"{forms_df.shape[0]} forms",
+            }
+            forms_df = pd.concat([forms_df, pd.DataFrame([totals])], ignore_index=True)
+            forms_df["filesSize"] = self._human_friendly_filesizes(forms_df["filesSize"])
+        forms_df.set_index("name", inplace=True)
+        if display:
             print(forms_df)
 
         if save2csv is not False:
-            forms_df.sort_values(by=[sort_by], inplace=True, ascending=False)
-            forms_df.set_index("name", inplace=True)
             output_file = _validate_path(str(save2csv))
             forms_df.to_csv(output_file, encoding="utf-8-sig")
 
@@ -548,7 +568,7 @@ class FormsiteInterface:
         Args:
             links_filter_re (str, optional): Only keep links that match the regex pattern string.. Defaults to r'.+'.
         """
-        if self.Links is None or links_regex != r".+":
+        if self.Links is None or links_regex != self._links_filter_re:
             self.ExtractLinks(links_filter_re=links_regex)
         return self.Links
 
@@ -565,13 +585,12 @@ class FormsiteInterface:
             links_regex (str, optional): Include only links that match target regex. Defaults to r'.+'.
             sort_descending (bool, optional): Defaults to True.
         """
-        if self.Links is None or links_regex != r".+":
+        if self.Links is None or links_regex != self._links_filter_re:
             self.ExtractLinks(links_filter_re=links_regex)
         output_file = _validate_path(destination_path)
-        sorted_links = [link + "\n" for link in self.Links]
-        sorted_links.sort(reverse=sort_descending)
         with open(output_file, "w") as writer:
-            writer.writelines(sorted_links)
+            for link in sorted(self.Links, reverse=sort_descending):
+                writer.write(f"{link}\n")
 
     def DownloadFiles(
         self,
@@ -602,7 +621,7 @@ class FormsiteInterface:
         Raises:
             AssertationError: if len(self.Links) < 1, ie. there is nothing to download.
         """
-        if self.Links is None:
+        if self.Links is None or links_regex != self._links_filter_re:
             self.ExtractLinks(links_filter_re=links_regex)
         assert (
             len(self.Links) > 0
@@ -621,7 +640,7 @@ class FormsiteInterface:
             display_progress=self.display_progress,
             strip_prefix=strip_prefix,
         )
-        asyncio.get_event_loop().run_until_complete(download_handler.Start())
+        asyncio.run(download_handler.Start())
 
     def ListColumns(self, print_stdout: bool = True) -> pd.DataFrame:
         """Prints list of columns (items, usercontrols) and their respective formsite IDs."""
@@ -630,6 +649,7 @@ class FormsiteInterface:
             params=self.params,
             auth=self.auth,
             display_progress=self.display_progress,
+            session=self.session,
         )
         api_handler.check_pages = False
         items, _ = api_handler.Start(get_items=True, get_results=False)
@@ -637,7 +657,8 @@ class FormsiteInterface:
         if print_stdout:
             print("id : label")
             print("-----items----")
-            items.apply(lambda row: print(f"{row['id']} : {row['label']}"), axis=1)
+            for item_id, label in zip(items["id"], items["label"]):
+                print(f"{item_id} : {label}")
             print("---metadata---")
             print("id : Reference #")
             print("result_status : Status")
@@ -680,18 +701,15 @@ class FormsiteInterface:
         if self.Data is None:
             self.FetchResults()
         output_file = _validate_path(destination_path)
-        if re.search(".+\\.txt$", output_file) is not None:
+        if output_file.endswith(".txt"):
             self.Data.to_string(output_file, encoding=encoding, index=False)
-        elif (
-            re.search(".+\\.pkl$", output_file) is not None
-            or re.search(".+\\.pickle$", output_file) is not None
-        ):
+        elif output_file.endswith((".pkl", ".pickle")):
             self.Data.to_pickle(output_file)
-        elif re.search(".+\\.parquet$", output_file) is not None:
+        elif output_file.endswith(".parquet"):
             self.Data.to_parquet(output_file, index=False)
-        elif re.search(".+\\.md$", output_file) is not None:
+        elif output_file.endswith(".md"):
             self.Data.to_markdown(output_file, index=False)
-        elif re.search(".+\\.json$", output_file) is not None:
+        elif output_file.endswith(".json"):
             try:
                 self.Data.to_json(output_file, orient="records", date_format="iso")
             except ValueError:
@@ -710,9 +728,8 @@ class FormsiteInterface:
                     if column_name in renamer
                     else column_name
                 ).to_json(output_file, orient="records", date_format="iso")
-        elif re.search(".+\\.xlsx$", output_file) is not None:
-            print("Writing to excel (this can be slow for large files!)")
-            self.Data.to_excel(output_file, index=False)
+        elif output_file.endswith(".xlsx"):
+            _write_excel(self.Data, output_file)
         else:
             line_terminator = (
                 os.linesep if line_terminator == "os_default" else line_terminator
@@ -720,7 +737,6 @@ class FormsiteInterface:
             self.Data.to_csv(
                 output_file,
                 index=False,
-                chunksize=1024,
                 encoding=encoding,
                 date_format=date_format,
                 line_terminator=line_terminator,
@@ -729,7 +745,7 @@ class FormsiteInterface:
             )
 
     def WriteLatestRef(self, destination_path: str) -> None:
-        """Writes `max(self.Data['Reference #])` to a file.
+        """Writes `self.Data['Reference #'].max()` to a file.
 
         Args:
             `destination_path` (str): A Valid path to an output csv file.
@@ -743,9 +759,9 @@ class FormsiteInterface:
         output_file = _validate_path(destination_path)
         if "id" in self.Data.columns or "Reference #" in self.Data.columns:
             try:
-                latest_ref = max(self.Data["Reference #"])
+                latest_ref = self.Data["Reference #"].max()
             except KeyError:
-                latest_ref = max(self.Data["id"])
+                latest_ref = self.Data["id"].max()
             with open(output_file, "w") as writer:
                 writer.write(str(latest_ref))
         else:
@@ -4,12 +4,25 @@ processing.py
 This module handles processing of results from API jsons. Returns a dataframe.
 """
 from __future__ import annotations
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, Iterable
 from dataclasses import dataclass
 from tqdm import tqdm
 import pandas as pd
 
+# metadata columns exported as plain text
+_STR_COLUMNS = (
+    "result_status",
+    "payment_status",
+    "payment_amount",
+    "login_username",
+    "login_email",
+    "user_ip",
+    "user_browser",
+    "user_device",
+    "user_referrer",
+)
+
 
 @dataclass
 class _FormsiteProcessing:
@@ -80,55 +93,47 @@ class _FormsiteProcessing:
             "score": "Score",
         }
 
-    def _process_items_row(self, items: dict) -> pd.Series:
-        """Converts a single 'items' record to a pandas Series
+    def _process_items_row(self, items: dict) -> dict:
+        """Converts a single 'items' record to a column id: value mapping
 
         Args:
             items (dict): ['items'] key from a results dict record
 
         Returns:
-            pd.Series: a row of the new output csv
+            dict: items part of a row of the new output csv
         """
-        cols = []
-        row = []
-        for t in items:
-            cols.append(str(t["id"]))
-            if t.get("values") is not None:
-                values = []
-                for val in t["values"]:
-                    values.append(val["value"])
-                value = " | ".join(values)
-            else:
-                value = t["value"]
-            row.append(value)
-        return pd.Series(row, cols)
-
-    def _process_metadata_row(self, result: dict) -> pd.Series:
-        """Converts all non-['items'] keys to a pd.Series row
+        return {
+            str(t["id"]): t["value"]
+            if "value" in t
+            else " | ".join(v["value"] for v in t["values"])
+            for t in items
+        }
+
+    def _process_row(self, in_json: dict) -> dict:
+        """Merges metadata and items of a single results record into a single row.
 
         Args:
-            result (dict): an single results json record
+            in_json (dict): a single results record json
 
         Returns:
-            pd.Series: A row containing all metadata-related information
+            dict: a row
         """
-        if "items" in result:
-            del result["items"]
-        return pd.Series(result)
+        row = {key: value for key, value in in_json.items() if key != "items"}
+        row.update(self._process_items_row(in_json["items"]))
+        return row
 
-    def _process_row(self, in_json: dict):
-        """Merges metadata_row and items_row into a single row.
+    def _process_page(self, results_json: dict) -> pd.DataFrame:
+        """Converts one page of the results API response to a DataFrame.
 
         Args:
-            in_json (dict): a single results record json
+            results_json (dict): a single results API response
 
         Returns:
-            pd.Series: a row
+            pd.DataFrame: one row per record on the page
         """
-        items = self._process_items_row(in_json["items"])
-        metadata = self._process_metadata_row(in_json)
-        concated = pd.concat((metadata, items), axis=0)
-        return concated
+        return pd.DataFrame(
+            [self._process_row(json_row) for json_row in results_json["results"]]
+        )
 
     def _reorder_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Orders existing columns into a standard export format.
@@ -140,54 +145,33 @@ class _FormsiteProcessing:
         Returns:
             pd.DataFrame: Ordered DataFrame
         """
-        left_side = []
-        right_side = []
-        if "id" in df.columns:
-            left_side.append("id")
-        if "result_status" in df.columns:
-            left_side.append("result_status")
-
-        if len(self.column_map.keys()) > 0:
-            middle = [
-                col
-                if (col in df.columns) and (col not in self.metadata_map.keys())
-                else None
-                for col in list(self.column_map.keys())
-            ]
-        else:
-            middle = []
-            for col in list(df.columns):
-                if col not in list(self.metadata_map.keys()):
-                    middle.append(col)
-
-        while None in middle:
-            middle.remove(None)
-        if "payment_status" in df.columns:
-            right_side.append("payment_status")
-        if "payment_amount" in df.columns:
-            right_side.append("payment_amount")
-        if "login_username" in df.columns:
-            right_side.append("login_username")
-        if "login_email" in df.columns:
-            right_side.append("login_email")
-        if "score" in df.columns:
-            right_side.append("score")
-        if "date_update" in df.columns:
-            right_side.append("date_update")
-        if "date_start" in df.columns:
-            right_side.append("date_start")
-        if "date_finish" in df.columns:
-            right_side.append("date_finish")
-        if "Duration (s)" in df.columns:
-            right_side.append("Duration (s)")
-        if "user_ip" in df.columns:
-            right_side.append("user_ip")
-        if "user_browser" in df.columns:
-            right_side.append("user_browser")
-        if "user_device" in df.columns:
-            right_side.append("user_device")
-        if "user_referrer" in df.columns:
-            right_side.append("user_referrer")
+        columns = set(df.columns)
+        left_side = [col for col in ("id", "result_status") if col in columns]
+        candidates = self.column_map.keys() if self.column_map else df.columns
+        middle = [
+            col
+            for col in candidates
+            if col in columns and col not in self.metadata_map
+        ]
+        right_side = [
+            col
+            for col in (
+                "payment_status",
+                "payment_amount",
+                "login_username",
+                "login_email",
+                "score",
+                "date_update",
+                "date_start",
+                "date_finish",
+                "Duration (s)",
+                "user_ip",
+                "user_browser",
+                "user_device",
+                "user_referrer",
+            )
+            if col in columns
+        ]
 
         final = left_side + middle + right_side
         return df[final]
@@ -201,40 +185,29 @@ class _FormsiteProcessing:
         Returns:
             pd.DataFrame: DataFrame with set dtypes
         """
-        if "id" in df.columns:
+        columns = set(df.columns)
+        if "id" in columns:
             df["id"] = df["id"].astype(int, errors="ignore")
-        if "result_status" in df.columns:
-            df["result_status"] = df["result_status"].astype(str)
-        if "payment_status" in df.columns:
-            df["payment_status"] = df["payment_status"].astype(str)
-        if "payment_amount" in df.columns:
-            df["payment_amount"] = df["payment_amount"].astype(str)
-        if "login_username" in df.columns:
-            df["login_username"] = df["login_username"].astype(str)
-        if "score" in df.columns:
+        if "score" in columns:
             df["score"] = df["score"].astype(int, errors="ignore")
-        if "login_email" in df.columns:
-            df["login_email"] = df["login_email"].astype(str)
-        if "date_update" in df.columns:
-            df["date_update"] = df["date_update"].apply(self._string2datetime)
-        if "date_start" in df.columns:
-            df["date_start"] = df["date_start"].apply(self._string2datetime)
-        if "date_finish" in df.columns:
-            df["date_finish"] = df["date_finish"].apply(self._string2datetime)
-        if "Duration (s)" in df.columns:
-            df["Duration (s)"] = df["Start Time"] - df["Start Time"]
-            df["Duration (s)"] = df["Duration (s)"].apply(lambda x: x.total_seconds())
-        if "user_ip" in df.columns:
-            df["user_ip"] = df["user_ip"].astype(str)
-        if "user_browser" in df.columns:
-            df["user_browser"] = df["user_browser"].astype(str)
-        if "user_device" in df.columns:
-            df["user_device"] = df["user_device"].astype(str)
-        if "user_referrer" in df.columns:
-            df["user_referrer"] = df["user_referrer"].astype(str)
+        str_cols = {col: str for col in _STR_COLUMNS if col in columns}
+        if str_cols:
+            df = df.astype(str_cols)
+        for col in ("date_update", "date_start", "date_finish"):
+            if col in columns:
+                df[col] = self._string2datetime(df[col])
+        if "Duration (s)" in columns:
+            df["Duration (s)"] = (df["date_finish"] - df["date_start"]).dt.total_seconds()
         return df
 
     def _sort_data(self, df: pd.DataFrame, ascending_bool: bool) -> pd.DataFrame:
+        if "Reference #" in df.columns and pd.api.types.is_integer_dtype(
+            df["Reference #"]
+        ):
+            order = df["Reference #"].to_numpy().argsort(kind="stable")
+            if not ascending_bool:
+                order = order[::-1]
+            return df.take(order).reset_index(drop=True)
         try:
             df = df.sort_values(by=["Reference #"], ascending=ascending_bool)
         except KeyError:
@@ -247,23 +220,23 @@ class _FormsiteProcessing:
 
     def Process(self) -> pd.DataFrame:
         """Loads jsons in results list as dataframes and concats them."""
-        results_list = []
-        for results in [json["results"] for json in self.results]:
-            results_list += results
-
-        series_list = [
-            self._process_row(json_row)
-            for json_row in tqdm(
-                results_list,
-                desc="Processing results",
-                unit=" rows",
-                ncols=80,
-                dynamic_ncols=True,
-                leave=False,
-            )
-        ]
-
-        dataframe = pd.DataFrame(series_list)
+        frames = []
+        with tqdm(
+            desc="Processing results",
+            unit=" rows",
+            ncols=80,
+            dynamic_ncols=True,
+            leave=False,
+            mininterval=0.5,
+            disable=not self.display_progress,
+        ) as pbar:
+            for results_json in self.results:
+                frames.append(self._process_page(results_json))
+                pbar.update(len(frames[-1]))
+
+        dataframe = (
+            pd.concat(frames, ignore_index=True, copy=False) if frames else pd.DataFrame()
+        )
         dataframe = self._reorder_columns(dataframe)
         dataframe = self._cast_dtypes(dataframe)
         if self.use_resultslabels:
@@ -271,19 +244,18 @@ class _FormsiteProcessing:
             combined_map.update(self.metadata_map)
             dataframe.rename(columns=combined_map, inplace=True)
         if self.params_last is not None:
-            dataframe = self._sort_data(dataframe, False)
-            until = int(self.params_last)
-            dataframe = dataframe.head(until)
-        dataframe = self._sort_data(dataframe, self.sort_asc)
+            dataframe = self._sort_data(dataframe, False).head(int(self.params_last))
+        # the `last` rows are already in descending order
+        if self.params_last is None or self.sort_asc:
+            dataframe = self._sort_data(dataframe, self.sort_asc)
         return dataframe
 
-    def _string2datetime(self, old_date: str) -> datetime:
-        """Converts ISO 8601 datetime string to datetime class."""
-        try:
-            new_date = datetime.strptime(
-                old_date, "%Y-%m-%dT%H:%M:%SZ"
-            )  # ISO 8601 standard
-            new_date = new_date + self.timezone_offset
-            return new_date
-        except TypeError:
-            return old_date
+    def _string2datetime(self, old_dates: pd.Series) -> pd.Series:
+        """Converts a column of ISO 8601 datetime strings to datetimes shifted by `self.timezone_offset`.
+        Columns that are already datetimes were shifted when parsed and are returned unchanged."""
+        if pd.api.types.is_datetime64_any_dtype(old_dates):
+            return old_dates
+        new_dates = pd.to_datetime(
+            old_dates, format="%Y-%m-%dT%H:%M:%SZ", errors="coerce"
+        )  # ISO 8601 standard
+        return new_dates + self.timezone_offset
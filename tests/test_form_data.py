@@ -1,5 +1,6 @@
 from formsite_util import FormData
-from tests.util import load_json, INPUTS_DIR
+from formsite_util._form_data import strftime_series
+from tests.util import load_json, INPUTS_DIR, OUTPUTS_DIR
 
 import pandas as pd
 
@@ -22,3 +23,22 @@ def test_FormData_constructor_pandas():
     form = FormData(results, items)
     assert form.results.equals(results)
     assert form.items == items
+
+
+def test_strftime_series_matches_strftime():
+    dates = pd.Series(
+        pd.to_datetime(["2021-01-02 03:04:05", "2022-12-31 23:59:59", None])
+    ).dt.tz_localize("UTC").dt.tz_convert("America/Chicago")
+    for date_format in ["%Y-%m-%d %H:%M:%S", "%d/%m/%Y %%", "%b %d %Y", ""]:
+        expected = dates.dt.strftime(date_format)
+        assert strftime_series(dates, date_format).equals(expected)
+
+
+def test_FormData_to_csv_without_date_format():
+    res = f"{INPUTS_DIR}/cache_results.feather"
+    itm = f"{INPUTS_DIR}/cache_items.json"
+    form = FormData(res, itm)
+    path = f"{OUTPUTS_DIR}/to_csv_no_date_format.csv"
+    form.to_csv(path, labels=False, date_format=None)
+    with open(path, "r", encoding="utf-8-sig") as fp:
+        assert fp.read() == form.results.to_csv(index=False)
@@ -0,0 +1,76 @@
+from io import BytesIO
+import pytest
+from requests import Response
+from requests.exceptions import ConnectionError as requests_ConnectionError
+from formsite_util import _form_fetcher
+from formsite_util._form_fetcher import FormFetcher
+from formsite_util._parameters import FormsiteParameters
+from formsite_util.consts import FETCH_RETRIES
+from formsite_util.error import FormsiteRateLimitException
+
+
+def create_fetcher() -> FormFetcher:
+    return FormFetcher("form_id", "token", "fs1", "directory", FormsiteParameters())
+
+
+def test_FormFetcher_context_manager_shares_session():
+    fetcher = create_fetcher()
+    with fetcher:
+        with fetcher._session_scope() as first:
+            pass
+        with fetcher._session_scope() as second:
+            pass
+        assert first is second
+        assert first.headers["Authorization"] == "bearer token"
+    assert fetcher._session is None
+
+
+def test_FormFetcher_without_context_manager_opens_session_per_fetch():
+    fetcher = create_fetcher()
+    assert fetcher._session is None
+    with fetcher._session_scope() as first:
+        assert first.headers["Authorization"] == "bearer token"
+    with fetcher._session_scope() as second:
+        pass
+    assert first is not second
+    assert fetcher._session is None
+
+
+class RefusingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None):
+        self.calls += 1
+        raise requests_ConnectionError("refused")
+
+
+class RateLimitedSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None):
+        self.calls += 1
+        response = Response()
+        response.status_code = 429
+        response.raw = BytesIO()
+        response._content = b"Too many requests"
+        return response
+
+
+def test_FormFetcher_fetch_result_gives_up_on_refused_connections(monkeypatch):
+    monkeypatch.setattr(_form_fetcher, "sleep", lambda seconds: None)
+    session = RefusingSession()
+    with pytest.raises(requests_ConnectionError):
+        create_fetcher().fetch_result(1, session)
+    assert session.calls == FETCH_RETRIES
+
+
+def test_FormFetcher_fetch_iterator_gives_up_when_rate_limited(monkeypatch):
+    monkeypatch.setattr(_form_fetcher, "sleep", lambda seconds: None)
+    fetcher = create_fetcher()
+    session = RateLimitedSession()
+    fetcher._session = session
+    with pytest.raises(FormsiteRateLimitException):
+        list(fetcher.fetch_iterator())
+    assert session.calls == FETCH_RETRIES
@@ -333,3 +333,12 @@ def test_parser_rename_map():
     with open(f"{INPUTS_DIR}/rename_map.json", "r", encoding="utf-8") as fp:
         saved_rename_map = json.load(fp)
     assert rename_map == saved_rename_map
+
+
+def test_parser_feed_pages_parallel():
+    pages = [create_example_results(50)[0] for _ in range(5)]
+    serial = FormParser()
+    _ = [serial.feed(p) for p in pages]
+    parallel = FormParser()
+    parallel.feed_pages_parallel(pages, workers=2)
+    assert parallel.data == serial.data
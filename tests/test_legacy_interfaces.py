@@ -0,0 +1,30 @@
+from formsite_util.legacy import FormsiteCredentials, FormsiteInterface
+
+
+def create_interface() -> FormsiteInterface:
+    auth = FormsiteCredentials("token", "fs1", "directory")
+    return FormsiteInterface("form_id", auth, display_progress=False)
+
+
+def test_FormsiteInterface_context_manager_shares_session():
+    interface = create_interface()
+    assert interface.session is None
+    with interface:
+        with interface._session_scope() as first:
+            pass
+        with interface._session_scope() as second:
+            pass
+        assert first is second
+        assert first.headers["Authorization"] == "bearer token"
+    assert interface.session is None
+
+
+def test_FormsiteInterface_close_without_session():
+    interface = create_interface()
+    interface.close()
+    with interface._session_scope() as first:
+        pass
+    with interface._session_scope() as second:
+        pass
+    assert first is not second
+    assert interface.session is None
@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+import pandas as pd
+from formsite_util.legacy.processing import _FormsiteProcessing
+
+
+def test_cast_dtypes_keeps_parsed_dates():
+    processing = _FormsiteProcessing(
+        {"items": []}, [], timedelta(hours=-5), display_progress=False
+    )
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "date_start": ["2021-01-01T00:00:00Z", "2021-01-02T12:30:00Z"],
+            "date_finish": ["2021-01-01T00:10:00Z", "2021-01-02T13:00:00Z"],
+        }
+    )
+    parsed = processing._cast_dtypes(df)
+    expected = pd.Series(pd.to_datetime(["2020-12-31 19:00:00", "2021-01-02 07:30:00"]))
+    assert parsed["date_start"].equals(expected.rename("date_start"))
+    reparsed = processing._cast_dtypes(parsed.copy())
+    assert reparsed["date_start"].equals(parsed["date_start"])
+    assert reparsed["date_finish"].equals(parsed["date_finish"])